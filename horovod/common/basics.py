@@ -13,8 +13,10 @@
 # limitations under the License.
 # =============================================================================
 
+import array
 import atexit
 import ctypes
+import itertools
 import os
 from typing import *
 # for type annotations, importing mpi4py has dangerous side effects
@@ -26,6 +28,52 @@ from horovod.common.process_sets import ProcessSet, global_process_set, _init_pr
 from horovod.common import util as util
 
 
+def _c_function(lib, name, restype, argtypes=()):
+    """Looks up the C function `name` in `lib` and declares its prototype, so that ctypes does not have to infer
+    argument and return types on every call."""
+    func = getattr(lib, name)
+    func.restype = restype
+    func.argtypes = list(argtypes)
+    return func
+
+
+def _c_int_view(buf):
+    """Returns a ctypes int array sharing the buffer of the `array.array` `buf` of type code 'i'."""
+    return (ctypes.c_int * len(buf)).from_buffer(buf)
+
+
+def _c_int_array(values):
+    """Returns a ctypes int array holding `values`. The array shares the buffer of an `array.array`, which is filled
+    in C rather than element by element through ctypes."""
+    return _c_int_view(array.array('i', values))
+
+
+_MPI = None
+_MPI_COMM_CTYPE = None
+
+
+def _mpi():
+    """Returns the mpi4py.MPI module, imported when first needed to avoid its side effects for users that do not pass
+    MPI communicators."""
+    global _MPI
+    if _MPI is None:
+        from mpi4py import MPI
+        _MPI = MPI
+    return _MPI
+
+
+def _get_mpi_comm_ctype():
+    """Returns the ctype of an MPI_Comm handle as used by mpi4py, determined when first needed."""
+    global _MPI_COMM_CTYPE
+    if _MPI_COMM_CTYPE is None:
+        MPI = _mpi()
+        if MPI._sizeof(MPI.Comm) == ctypes.sizeof(ctypes.c_int):
+            _MPI_COMM_CTYPE = ctypes.c_int
+        else:
+            _MPI_COMM_CTYPE = ctypes.c_void_p
+    return _MPI_COMM_CTYPE
+
+
 class HorovodBasics(object):
     """Wrapper class for the basic Horovod API."""
 
@@ -44,6 +92,95 @@ class HorovodBasics(object):
         self.HOROVOD_PROCESS_SET_ERROR_FOREIGN_SET = -4
         self.HOROVOD_PROCESS_SET_ERROR_SHUTDOWN = -5
         self.HOROVOD_PROCESS_SET_ERROR_EXISTING_SET = -6
+        self.HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE = -7
+
+        # Messages of the ValueErrors raised for the error codes returned by the process set functions
+        not_initialized = 'Horovod has not been initialized; use hvd.init().'
+        shutting_down = 'Horovod is shutting down.'
+        unknown_set = "Process set does not exist or has not been registered."
+        self._add_process_set_errors = {
+            self.HOROVOD_PROCESS_SET_ERROR_INIT: not_initialized,
+            self.HOROVOD_PROCESS_SET_ERROR_SHUTDOWN: shutting_down,
+            self.HOROVOD_PROCESS_SET_ERROR_DYNAMIC:
+                "Set HOROVOD_DYNAMIC_PROCESS_SETS=1 to allow adding process sets after Horovod initialization.",
+        }
+        self._remove_process_set_errors = {
+            self.HOROVOD_PROCESS_SET_ERROR_INIT: not_initialized,
+            self.HOROVOD_PROCESS_SET_ERROR_SHUTDOWN: shutting_down,
+            self.HOROVOD_PROCESS_SET_ERROR_DYNAMIC:
+                "Set HOROVOD_DYNAMIC_PROCESS_SETS=1 to allow removing process sets after Horovod initialization.",
+        }
+        self._process_set_rank_errors = {
+            self.HOROVOD_PROCESS_SET_ERROR_INIT: not_initialized,
+            self.HOROVOD_PROCESS_SET_ERROR_FOREIGN_SET: "Process is not part of provided process set.",
+            self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET: unknown_set,
+        }
+        self._process_set_size_errors = {
+            self.HOROVOD_PROCESS_SET_ERROR_INIT: not_initialized,
+            self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET: unknown_set,
+        }
+        self._comm_process_set_errors = {
+            self.HOROVOD_PROCESS_SET_ERROR_INIT:
+                'Horovod has not been initialized or MPI has not been enabled; use hvd.init().',
+            self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
+                'MPI communicator does not correspond to any registered process set.',
+        }
+
+        # Declare prototypes once so that calls below dispatch directly. Functions taking MPI_Comm arguments are
+        # bound by _bind_mpi_comm_functions() because their prototype depends on mpi4py.
+        lib = self.MPI_LIB_CTYPES
+        c_int_p = ctypes.POINTER(ctypes.c_int)
+        self._horovod_init = _c_function(lib, 'horovod_init', ctypes.c_bool,
+                                         [c_int_p, ctypes.c_int, c_int_p, c_int_p, ctypes.c_int])
+        self._horovod_shutdown = _c_function(lib, 'horovod_shutdown', None)
+        self._horovod_is_initialized = _c_function(lib, 'horovod_is_initialized', ctypes.c_bool)
+        self._horovod_start_timeline = _c_function(lib, 'horovod_start_timeline', ctypes.c_int,
+                                                   [ctypes.c_char_p, ctypes.c_bool])
+        self._horovod_stop_timeline = _c_function(lib, 'horovod_stop_timeline', ctypes.c_int)
+        self._horovod_size = _c_function(lib, 'horovod_size', ctypes.c_int)
+        self._horovod_local_size = _c_function(lib, 'horovod_local_size', ctypes.c_int)
+        self._horovod_cross_size = _c_function(lib, 'horovod_cross_size', ctypes.c_int)
+        self._horovod_rank = _c_function(lib, 'horovod_rank', ctypes.c_int)
+        self._horovod_local_rank = _c_function(lib, 'horovod_local_rank', ctypes.c_int)
+        self._horovod_cross_rank = _c_function(lib, 'horovod_cross_rank', ctypes.c_int)
+        self._horovod_is_homogeneous = _c_function(lib, 'horovod_is_homogeneous', ctypes.c_bool)
+        self._horovod_mpi_threads_supported = _c_function(lib, 'horovod_mpi_threads_supported', ctypes.c_int)
+        self._horovod_mpi_enabled = _c_function(lib, 'horovod_mpi_enabled', ctypes.c_bool)
+        self._horovod_mpi_built = _c_function(lib, 'horovod_mpi_built', ctypes.c_bool)
+        self._horovod_gloo_enabled = _c_function(lib, 'horovod_gloo_enabled', ctypes.c_bool)
+        self._horovod_gloo_built = _c_function(lib, 'horovod_gloo_built', ctypes.c_bool)
+        self._horovod_nccl_built = _c_function(lib, 'horovod_nccl_built', ctypes.c_int)
+        self._horovod_ddl_built = _c_function(lib, 'horovod_ddl_built', ctypes.c_bool)
+        self._horovod_ccl_built = _c_function(lib, 'horovod_ccl_built', ctypes.c_bool)
+        self._horovod_cuda_built = _c_function(lib, 'horovod_cuda_built', ctypes.c_bool)
+        self._horovod_rocm_built = _c_function(lib, 'horovod_rocm_built', ctypes.c_bool)
+        self._horovod_add_process_set = _c_function(lib, 'horovod_add_process_set', ctypes.c_int,
+                                                    [c_int_p, ctypes.c_int])
+        self._horovod_remove_process_set = _c_function(lib, 'horovod_remove_process_set', ctypes.c_int,
+                                                       [ctypes.c_int])
+        self._horovod_process_set_rank = _c_function(lib, 'horovod_process_set_rank', ctypes.c_int,
+                                                     [ctypes.c_int])
+        self._horovod_process_set_size = _c_function(lib, 'horovod_process_set_size', ctypes.c_int,
+                                                     [ctypes.c_int])
+        self._horovod_number_of_process_sets = _c_function(lib, 'horovod_number_of_process_sets', ctypes.c_int)
+        self._horovod_number_of_process_set_ranks = _c_function(lib, 'horovod_number_of_process_set_ranks',
+                                                                ctypes.c_int)
+        self._horovod_process_sets_bulk = _c_function(lib, 'horovod_process_sets_bulk', ctypes.c_int,
+                                                      [c_int_p, c_int_p, c_int_p, ctypes.c_int, ctypes.c_int])
+
+        self._mpi_argtypes_set = False
+
+        # Build flags are constants of the loaded library, so query them only once.
+        self._mpi_built = bool(self._horovod_mpi_built())
+        self._gloo_built = bool(self._horovod_gloo_built())
+        self._nccl_built = int(self._horovod_nccl_built())
+        self._ddl_built = bool(self._horovod_ddl_built())
+        self._ccl_built = bool(self._horovod_ccl_built())
+        self._cuda_built = bool(self._horovod_cuda_built())
+        self._rocm_built = bool(self._horovod_rocm_built())
+
+        # Fixed while Horovod is initialized, cached on first query and reset by init() and shutdown().
+        self._is_homogeneous = None
 
     def init(self, comm: Optional[Union[Sequence[int], MPI.Comm]] = None,
              process_sets: Optional[Sequence[ProcessSet]] = None):
@@ -69,6 +206,7 @@ class HorovodBasics(object):
                HOROVOD_DYNAMIC_PROCESS_SETS=1 so we can call `hvd.add_process_set(...)` later.
         """
 
+        self._is_homogeneous = None
         if comm is None:
             comm = []
         if process_sets is None:
@@ -81,12 +219,15 @@ class HorovodBasics(object):
         process_sets_via_ranks = [ps for ps in process_sets if ps.ranks is not None]
         process_sets_via_comm = [ps for ps in process_sets if ps.mpi_comm is not None and ps.ranks is None]
 
-        process_set_sizes_via_ranks = [len(ps.ranks) for ps in process_sets_via_ranks]
-        process_set_ranks_via_ranks = [rank for process_set in process_sets_via_ranks for rank in process_set.ranks]
+        # Only pass distinct rank lists to the C library. Duplicates are still detected by _init_process_sets() below
+        # because it processes the full list. ProcessSet keeps its ranks sorted, so tuples serve as keys.
+        distinct_ranks_via_ranks = list(dict.fromkeys(tuple(ps.ranks) for ps in process_sets_via_ranks))
+        process_set_sizes_via_ranks = [len(ranks) for ranks in distinct_ranks_via_ranks]
+        process_set_ranks_via_ranks = itertools.chain.from_iterable(distinct_ranks_via_ranks)
         process_set_args_via_ranks = [
-            (ctypes.c_int * len(process_set_ranks_via_ranks))(*process_set_ranks_via_ranks),
-            (ctypes.c_int * len(process_set_sizes_via_ranks))(*process_set_sizes_via_ranks),
-            ctypes.c_int(len(process_set_sizes_via_ranks))
+            _c_int_array(process_set_ranks_via_ranks),
+            _c_int_array(process_set_sizes_via_ranks),
+            len(process_set_sizes_via_ranks)
         ]
 
         atexit.register(self.shutdown)
@@ -98,33 +239,27 @@ class HorovodBasics(object):
                 raise NotImplementedError(
                     "At this time process sets defined via MPI communicators are only supported when calling hvd.init() "
                     "with comm set to a global MPI communicator.")
-            comm_size = len(comm)
-            initialization_ok = self.MPI_LIB_CTYPES.horovod_init(
-                (ctypes.c_int * comm_size)(*comm), ctypes.c_int(comm_size),
-                *process_set_args_via_ranks)
+            comm_ranks = _c_int_array(comm)
+            initialization_ok = self._horovod_init(comm_ranks, len(comm_ranks), *process_set_args_via_ranks)
         else:
             if not self.mpi_built():
                 raise ValueError(
                     "Horovod has not been built with MPI support. Ensure MPI is installed and "
                     "reinstall Horovod with HOROVOD_WITH_MPI=1 to debug the build error.")
 
-            from mpi4py import MPI
+            MPI = _mpi()
             if not isinstance(comm, MPI.Comm):
                 raise ValueError(
                     "Invalid type of argument comm. Expected list of rank integers or mpi4py.MPI.Comm object.")
             global_process_set.mpi_comm = comm
-            if MPI._sizeof(MPI.Comm) == ctypes.sizeof(ctypes.c_int):
-                MPI_Comm = ctypes.c_int
-            else:
-                MPI_Comm = ctypes.c_void_p
+            self._bind_mpi_comm_functions()
+            MPI_Comm = _get_mpi_comm_ctype()
 
             comm_list = [comm] + [ps.mpi_comm for ps in process_sets_via_comm]
             comm_objs = [MPI_Comm.from_address(MPI._addressof(c)) for c in comm_list]
             num_comms = len(comm_list)
-            self.MPI_LIB_CTYPES.horovod_init_multi_comm.argtypes = [MPI_Comm * num_comms, ctypes.c_int]
-            initialization_ok = self.MPI_LIB_CTYPES.horovod_init_multi_comm((MPI_Comm * num_comms)(*comm_objs),
-                                                                            ctypes.c_int(num_comms),
-                                                                            *process_set_args_via_ranks)
+            initialization_ok = self._horovod_init_multi_comm((MPI_Comm * num_comms)(*comm_objs), num_comms,
+                                                              *process_set_args_via_ranks)
         if not initialization_ok:
             raise ValueError(
                 "Horovod initialization failed. Please check log messages above for a more descriptive error.")
@@ -144,13 +279,28 @@ class HorovodBasics(object):
                 raise ValueError(
                     f"Horovod could not be initialized because process_sets entry number {ps_idx} is a duplicate: {ps}")
 
+    def _bind_mpi_comm_functions(self):
+        """ Declares prototypes of the C functions taking MPI_Comm arguments. These are only available if Horovod was
+        built with MPI support. """
+        if self._mpi_argtypes_set:
+            return
+        MPI_Comm = _get_mpi_comm_ctype()
+        c_int_p = ctypes.POINTER(ctypes.c_int)
+        self._horovod_init_multi_comm = _c_function(
+            self.MPI_LIB_CTYPES, 'horovod_init_multi_comm', ctypes.c_bool,
+            [ctypes.POINTER(MPI_Comm), ctypes.c_int, c_int_p, c_int_p, ctypes.c_int])
+        self._horovod_comm_process_set = _c_function(self.MPI_LIB_CTYPES, 'horovod_comm_process_set', ctypes.c_int,
+                                                     [MPI_Comm])
+        self._mpi_argtypes_set = True
+
     def shutdown(self):
         """A function that shuts Horovod down."""
-        self.MPI_LIB_CTYPES.horovod_shutdown()
+        self._horovod_shutdown()
+        self._is_homogeneous = None
 
     def is_initialized(self):
         """Returns True if Horovod is initialized"""
-        return self.MPI_LIB_CTYPES.horovod_is_initialized()
+        return self._horovod_is_initialized()
 
     def start_timeline(self, file_path, mark_cycles=False):
         """Creates a timeline file at `file_path` and begins recording.
@@ -162,9 +312,7 @@ class HorovodBasics(object):
 
         Raises a `ValueError` if Horovod is not initialized.
         """
-        result = self.MPI_LIB_CTYPES.horovod_start_timeline(
-            ctypes.c_char_p(file_path.encode('utf-8')),
-            ctypes.c_bool(mark_cycles))
+        result = self._horovod_start_timeline(file_path.encode('utf-8'), mark_cycles)
         if result == -1:
             raise ValueError('Horovod has not been initialized; use hvd.init().')
         elif result == -2:
@@ -175,7 +323,7 @@ class HorovodBasics(object):
 
         Raises a `ValueError` if Horovod is not initialized.
         """
-        result = self.MPI_LIB_CTYPES.horovod_stop_timeline()
+        result = self._horovod_stop_timeline()
         if result == -1:
             raise ValueError('Horovod has not been initialized; use hvd.init().')
 
@@ -185,7 +333,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar containing the number of Horovod processes.
         """
-        size = self.MPI_LIB_CTYPES.horovod_size()
+        size = self._horovod_size()
         if size == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -198,7 +346,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar containing the number of local Horovod processes.
         """
-        local_size = self.MPI_LIB_CTYPES.horovod_local_size()
+        local_size = self._horovod_local_size()
         if local_size == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -213,7 +361,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar containing the number of cross Horovod processes.
         """
-        cross_size = self.MPI_LIB_CTYPES.horovod_cross_size()
+        cross_size = self._horovod_cross_size()
         if cross_size == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -225,7 +373,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar with the Horovod rank of the calling process.
         """
-        rank = self.MPI_LIB_CTYPES.horovod_rank()
+        rank = self._horovod_rank()
         if rank == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -239,7 +387,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar with the local Horovod rank of the calling process.
         """
-        local_rank = self.MPI_LIB_CTYPES.horovod_local_rank()
+        local_rank = self._horovod_local_rank()
         if local_rank == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -254,7 +402,7 @@ class HorovodBasics(object):
         Returns:
           An integer scalar with the cross Horovod rank of the calling process.
         """
-        cross_rank = self.MPI_LIB_CTYPES.horovod_cross_rank()
+        cross_rank = self._horovod_cross_rank()
         if cross_rank == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -266,8 +414,12 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether every node in the cluster has same number of ranks.
         """
-        is_homogeneous = self.MPI_LIB_CTYPES.horovod_is_homogeneous()
-        return bool(is_homogeneous)
+        if self._is_homogeneous is not None:
+            return self._is_homogeneous
+        is_homogeneous = bool(self._horovod_is_homogeneous())
+        if self._horovod_is_initialized():
+            self._is_homogeneous = is_homogeneous
+        return is_homogeneous
 
     def mpi_threads_supported(self):
         """A function that returns a flag indicating whether MPI multi-threading is supported.
@@ -278,12 +430,12 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether MPI multi-threading is supported.
         """
-        mpi_enabled = self.MPI_LIB_CTYPES.horovod_mpi_enabled()
+        mpi_enabled = self._horovod_mpi_enabled()
         if not bool(mpi_enabled):
             raise ValueError(
                 'Horovod MPI is not enabled; Please make sure it\'s installed and enabled.')
 
-        mpi_threads_supported = self.MPI_LIB_CTYPES.horovod_mpi_threads_supported()
+        mpi_threads_supported = self._horovod_mpi_threads_supported()
         if mpi_threads_supported == -1:
             raise ValueError(
                 'Horovod has not been initialized; use hvd.init().')
@@ -297,7 +449,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether MPI is enabled.
         """
-        mpi_enabled = self.MPI_LIB_CTYPES.horovod_mpi_enabled()
+        mpi_enabled = self._horovod_mpi_enabled()
         return bool(mpi_enabled)
 
     def mpi_built(self):
@@ -306,7 +458,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether MPI support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_mpi_built())
+        return self._mpi_built
 
     def gloo_enabled(self):
         """Returns True if Gloo is mode is currently enabled at runtime.
@@ -316,7 +468,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether Gloo is enabled.
         """
-        gloo_enabled = self.MPI_LIB_CTYPES.horovod_gloo_enabled()
+        gloo_enabled = self._horovod_gloo_enabled()
         return bool(gloo_enabled)
 
     def gloo_built(self):
@@ -325,7 +477,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether Gloo support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_gloo_built())
+        return self._gloo_built
 
     def nccl_built(self):
         """Function to check if Horovod was compiled with NCCL support.
@@ -335,7 +487,7 @@ class HorovodBasics(object):
           If NCCL support was compiled, returns NCCL_VERSION_CODE. Otherwise,
           returns 0.
         """
-        return int(self.MPI_LIB_CTYPES.horovod_nccl_built())
+        return self._nccl_built
 
     def ddl_built(self):
         """Returns True if Horovod was compiled with DDL support.
@@ -343,7 +495,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether DDL support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_ddl_built())
+        return self._ddl_built
 
     def ccl_built(self):
         """Returns True if Horovod was compiled with oneCCL support.
@@ -351,7 +503,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether oneCCL support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_ccl_built())
+        return self._ccl_built
 
     def cuda_built(self):
         """Returns True if Horovod was compiled with CUDA support.
@@ -359,7 +511,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether CUDA support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_cuda_built())
+        return self._cuda_built
 
     def rocm_built(self):
         """Returns True if Horovod was compiled with ROCm support.
@@ -367,7 +519,7 @@ class HorovodBasics(object):
         Returns:
           A boolean value indicating whether ROCm support was compiled.
         """
-        return bool(self.MPI_LIB_CTYPES.horovod_rocm_built())
+        return self._rocm_built
 
     def _add_process_set_impl(self, ranks: Sequence[int]) -> Optional[int]:
         """ Add a new process set and return its id. If a process set containing the same ranks exists already, return
@@ -375,21 +527,13 @@ class HorovodBasics(object):
 
         Requires running with HOROVOD_DYNAMIC_PROCESS_SETS=1.
         """
-        if not isinstance(ranks, list):
-            ranks = list(ranks)
-        nrank = len(ranks)
-        result = int(self.MPI_LIB_CTYPES.horovod_add_process_set(
-            (ctypes.c_int * nrank)(*ranks), ctypes.c_int(nrank)))
-        if result == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-            raise ValueError('Horovod has not been initialized; use hvd.init().')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_SHUTDOWN:
-            raise ValueError('Horovod is shutting down.')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_DYNAMIC:
-            raise ValueError(
-                "Set HOROVOD_DYNAMIC_PROCESS_SETS=1 to allow adding process sets after Horovod initialization.")
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_EXISTING_SET:
+        ranks_array = _c_int_array(ranks)
+        result = self._horovod_add_process_set(ranks_array, len(ranks_array))
+        if result >= 0:
+            return result
+        if result == self.HOROVOD_PROCESS_SET_ERROR_EXISTING_SET:
             return None
-        return result
+        raise ValueError(self._add_process_set_errors[result])
 
     def _remove_process_set_impl(self, process_set_id: int) -> Optional[int]:
         """ Remove process set with given id. If removal is succesful, return process_set_id.
@@ -401,67 +545,53 @@ class HorovodBasics(object):
         assert isinstance(process_set_id, int)
         if process_set_id == 0:
             return None
-        result = int(self.MPI_LIB_CTYPES.horovod_remove_process_set(
-            ctypes.c_int(process_set_id)))
-        if result == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-            raise ValueError('Horovod has not been initialized; use hvd.init().')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_SHUTDOWN:
-            raise ValueError('Horovod is shutting down.')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_DYNAMIC:
-            raise ValueError(
-                "Set HOROVOD_DYNAMIC_PROCESS_SETS=1 to allow removing process sets after Horovod initialization.")
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
+        result = self._horovod_remove_process_set(process_set_id)
+        if result >= 0:
+            return result
+        if result == self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
             return None
-        return result
+        raise ValueError(self._remove_process_set_errors[result])
 
     def _process_set_rank(self, process_set_id: int) -> int:
         """ Return process rank relative to the process set with the given id. """
         assert isinstance(process_set_id, int)
-        result = int(self.MPI_LIB_CTYPES.horovod_process_set_rank(
-            ctypes.c_int(process_set_id)))
-        if result == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-            raise ValueError('Horovod has not been initialized; use hvd.init().')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_FOREIGN_SET:
-            raise ValueError("Process is not part of provided process set.")
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
-            raise ValueError("Process set does not exist or has not been registered.")
-        return result
+        result = self._horovod_process_set_rank(process_set_id)
+        if result >= 0:
+            return result
+        raise ValueError(self._process_set_rank_errors[result])
 
     def _process_set_size(self, process_set_id: int) -> int:
         """ Return size of the process set with the given id. """
         assert isinstance(process_set_id, int)
-        result = int(self.MPI_LIB_CTYPES.horovod_process_set_size(
-            ctypes.c_int(process_set_id)))
-        if result == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-            raise ValueError('Horovod has not been initialized; use hvd.init().')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
-            raise ValueError("Process set does not exist or has not been registered.")
-        return result
+        result = self._horovod_process_set_size(process_set_id)
+        if result >= 0:
+            return result
+        raise ValueError(self._process_set_size_errors[result])
 
     def _get_process_set_ids_and_ranks(self) -> Dict[int, List[int]]:
         """ Returns a dictionary { process_set_id: list of process set ranks }, for internal use.
 
         Note that this function does not lock the Horovod-internal ProcessSetTable. If the Horovod background thread
         shuts down while the Python thread is still executing this function, there can be spurious failures. """
-        num = int(self.MPI_LIB_CTYPES.horovod_number_of_process_sets())
-        ids_array = (ctypes.c_int * num)()
-        self.MPI_LIB_CTYPES.horovod_process_set_ids(ids_array)
+        num = self._horovod_number_of_process_sets()
+        num_ranks = self._horovod_number_of_process_set_ranks()
+        ids_buf = array.array('i', [0]) * num
+        sizes_buf = array.array('i', [0]) * num
+        ranks_buf = array.array('i', [0]) * num_ranks
+        res = self._horovod_process_sets_bulk(_c_int_view(ids_buf), _c_int_view(sizes_buf), _c_int_view(ranks_buf),
+                                              num, num_ranks)
+        if res == self.HOROVOD_PROCESS_SET_ERROR_INIT:
+            raise ValueError('Horovod has not been initialized properly; use hvd.init().')
+        elif res < 0:
+            raise RuntimeError("Process set table was modified outside of _get_process_set_ids_and_ranks()")
+
+        # Convert each buffer to Python ints in one go, then only slice lists.
+        ranks = ranks_buf.tolist()
         ret = {}
-        for ps_id in ids_array:
-            ps_size = int(self.MPI_LIB_CTYPES.horovod_process_set_size(ctypes.c_int(ps_id)))
-
-            if ps_size == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-                raise ValueError('Horovod has not been initialized properly; use hvd.init().')
-            elif ps_size < 0:
-                raise RuntimeError("Process set table was modified outside of _get_process_set_ids_and_ranks()")
-
-            ranks_array = (ctypes.c_int * ps_size)()
-            res = int(self.MPI_LIB_CTYPES.horovod_process_set_ranks(ctypes.c_int(ps_id), ranks_array))
-            if res == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-                raise ValueError('Horovod has not been initialized properly; use hvd.init().')
-            elif res < 0:
-                raise RuntimeError("Process set table was modified outside of _get_process_set_ids_and_ranks()")
-            ret[ps_id] = list(ranks_array)
+        offset = 0
+        for ps_id, ps_size in zip(ids_buf[:res].tolist(), sizes_buf[:res].tolist()):
+            ret[ps_id] = ranks[offset:offset + ps_size]
+            offset += ps_size
         return ret
 
     def _comm_process_set_id(self, comm: MPI.Comm) -> int:
@@ -471,17 +601,10 @@ class HorovodBasics(object):
                 "Horovod has not been built with MPI support. Ensure MPI is installed and "
                 "reinstall Horovod with HOROVOD_WITH_MPI=1 to debug the build error.")
 
-        from mpi4py import MPI
-        if MPI._sizeof(MPI.Comm) == ctypes.sizeof(ctypes.c_int):
-            MPI_Comm = ctypes.c_int
-        else:
-            MPI_Comm = ctypes.c_void_p
-
-        self.MPI_LIB_CTYPES.horovod_comm_process_set.argtypes = [MPI_Comm]
-        comm_obj = MPI_Comm.from_address(MPI._addressof(comm))
-        result = int(self.MPI_LIB_CTYPES.horovod_comm_process_set(comm_obj))
-        if result == self.HOROVOD_PROCESS_SET_ERROR_INIT:
-            raise ValueError('Horovod has not been initialized or MPI has not been enabled; use hvd.init().')
-        elif result == self.HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET:
-            raise ValueError('MPI communicator does not correspond to any registered process set.')
-        return result
+        MPI = _mpi()
+        self._bind_mpi_comm_functions()
+        comm_obj = _get_mpi_comm_ctype().from_address(MPI._addressof(comm))
+        result = self._horovod_comm_process_set(comm_obj)
+        if result >= 0:
+            return result
+        raise ValueError(self._comm_process_set_errors[result])
@@ -1190,6 +1190,7 @@ const int HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET = -3;
 const int HOROVOD_PROCESS_SET_ERROR_FOREIGN_SET = -4;
 const int HOROVOD_PROCESS_SET_ERROR_SHUTDOWN = -5;
 const int HOROVOD_PROCESS_SET_ERROR_EXISTING_SET = -6;
+const int HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE = -7;
 
 int horovod_add_process_set(const int* ranks, int nrank) {
   if (!horovod_global.initialization_done) {
@@ -1335,6 +1336,47 @@ int horovod_process_set_ranks(int id, int* ranks_prealloc) {
   return 0;
 }
 
+int horovod_number_of_process_set_ranks() {
+  std::lock_guard<std::recursive_mutex> table_lock(
+      horovod_global.process_set_table.mutex);
+  int total = 0;
+  for (auto id : horovod_global.process_set_table.Ids()) {
+    total += static_cast<int>(horovod_global.process_set_table.Get(id)
+                                  .registered_global_ranks.size());
+  }
+  return total;
+}
+
+int horovod_process_sets_bulk(int* ids_prealloc, int* sizes_prealloc,
+                              int* ranks_prealloc, int max_process_sets,
+                              int max_ranks) {
+  if (!horovod_global.initialization_done) {
+    return HOROVOD_PROCESS_SET_ERROR_INIT;
+  }
+  std::lock_guard<std::recursive_mutex> table_lock(
+      horovod_global.process_set_table.mutex);
+  const auto ids_vec = horovod_global.process_set_table.Ids();
+  if (static_cast<int>(ids_vec.size()) > max_process_sets) {
+    return HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE;
+  }
+  int num_ranks = 0;
+  for (size_t i = 0; i < ids_vec.size(); ++i) {
+    const auto& process_set = horovod_global.process_set_table.Get(ids_vec[i]);
+    if (!process_set.initialization_done) {
+      return HOROVOD_PROCESS_SET_ERROR_INIT;
+    }
+    const auto& ranks = process_set.registered_global_ranks;
+    if (num_ranks + static_cast<int>(ranks.size()) > max_ranks) {
+      return HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE;
+    }
+    ids_prealloc[i] = ids_vec[i];
+    sizes_prealloc[i] = static_cast<int>(ranks.size());
+    std::copy(ranks.begin(), ranks.end(), ranks_prealloc + num_ranks);
+    num_ranks += static_cast<int>(ranks.size());
+  }
+  return static_cast<int>(ids_vec.size());
+}
+
 }
 
 // Contexts and controller must be initialized and the background thread
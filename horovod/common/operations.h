@@ -121,6 +121,7 @@ extern const int HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET;
 extern const int HOROVOD_PROCESS_SET_ERROR_FOREIGN_SET;
 extern const int HOROVOD_PROCESS_SET_ERROR_EXISTING_SET;
 extern const int HOROVOD_PROCESS_SET_ERROR_SHUTDOWN;
+extern const int HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE;
 
 // C interface to register a new process set containing the given ranks
 // (blocking). Returns positive process set id or an error code:
@@ -169,6 +170,19 @@ void horovod_process_set_ids(int* ids_prealloc);
 // HOROVOD_PROCESS_SET_ERROR_UNKNOWN_SET if the process set is unknown,
 int horovod_process_set_ranks(int id, int* ranks_prealloc);
 
+// C interface to return the sum of the sizes of all process sets.
+int horovod_number_of_process_set_ranks();
+
+// C interface to assign the ids of all process sets, their sizes, and their
+// ranks concatenated in the same order to the preallocated arrays, which can
+// hold max_process_sets ids and sizes and max_ranks ranks. Returns the number
+// of process sets or an error code:
+// HOROVOD_PROCESS_SET_ERROR_INIT if Horovod or a process set is not initialized,
+// HOROVOD_PROCESS_SET_ERROR_BUFFER_SIZE if the preallocated arrays are too small.
+int horovod_process_sets_bulk(int* ids_prealloc, int* sizes_prealloc,
+                              int* ranks_prealloc, int max_process_sets,
+                              int max_ranks);
+
 #if HAVE_MPI
 // C interface to return process set id corresponding to processes belonging
 // to this MPI communicator or an error code: